@@ -4,8 +4,8 @@ use std::path::PathBuf;
 use crate::cli::Cli;
 use crate::constants::{BOLD, END};
 use crate::output::{
-    build_initial_report, clear_output_capture, now_millis, output_capture_snapshot, print_error,
-    print_info, print_plain, prompt_export_json_decision, write_json_report,
+    ansi, build_initial_report, clear_output_capture, now_millis, output_capture_snapshot,
+    print_error, print_info, print_plain, prompt_export_json_decision, write_json_report,
 };
 use crate::verify;
 
@@ -13,7 +13,8 @@ pub fn run_cli(cli: Cli) -> i32 {
     clear_output_capture();
     let mut report = build_initial_report(&cli);
 
-    println!("{BOLD}Kaspa Genesis Proof Verification (Rust-Native){END}");
+    let (bold, end) = (ansi(BOLD), ansi(END));
+    println!("{bold}Kaspa Genesis Proof Verification (Rust-Native){end}");
     print_plain(&format!("Requested node type: {:?}", cli.node_type));
 
     if let Some(datadir) = cli.datadir.as_deref() {
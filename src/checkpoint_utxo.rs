@@ -3,8 +3,10 @@ use flate2::read::GzDecoder;
 use kaspa_muhash::MuHash;
 use std::fs::{self, File};
 use std::io::{BufReader, Cursor, Read};
+use std::num::NonZeroUsize;
 use std::path::Path;
-use std::sync::OnceLock;
+use std::sync::{OnceLock, mpsc};
+use std::thread;
 
 use crate::model::Hash32;
 
@@ -17,6 +19,10 @@ pub(crate) const REFERENCE_SCHEDULE_KAS_PER_DAA: u64 = 500;
 
 const EMBEDDED_CHECKPOINT_UTXO_DUMP_GZ: &[u8] =
     include_bytes!("../resources/kaspad-v0.11.5-2-utxos.gz");
+const CHECKPOINT_UTXO_SCAN_BATCH_RECORDS: usize = 4096;
+const CHECKPOINT_UTXO_SCAN_MAX_WORKERS: usize = 8;
+// 63 fixed bytes plus a P2PK script; longer records just grow the batch buffer.
+const CHECKPOINT_UTXO_TYPICAL_RECORD_BYTES: usize = 100;
 static EMBEDDED_CHECKPOINT_SCAN: OnceLock<Result<CheckpointUtxoScan, String>> = OnceLock::new();
 
 #[derive(Clone, Debug)]
@@ -129,39 +135,125 @@ fn scan_checkpoint_utxo_dump_reader<R: Read>(
     reader: &mut BufReader<R>,
     compressed_size_bytes: u64,
 ) -> Result<CheckpointUtxoScan> {
-    let mut muhash = MuHash::new();
-    let mut total_sompi = 0u64;
-    let mut record_count = 0u64;
-
-    loop {
-        let mut framed_size = [0u8; 1];
-        let bytes_read = reader
-            .read(&mut framed_size)
-            .context("failed reading checkpoint record length")?;
-        if bytes_read == 0 {
-            break;
+    let workers = thread::available_parallelism()
+        .map_or(1, NonZeroUsize::get)
+        .min(CHECKPOINT_UTXO_SCAN_MAX_WORKERS);
+    scan_checkpoint_utxo_dump_reader_parallel(
+        reader,
+        compressed_size_bytes,
+        workers,
+        CHECKPOINT_UTXO_SCAN_BATCH_RECORDS,
+    )
+}
+
+fn scan_checkpoint_utxo_dump_reader_parallel<R: Read>(
+    reader: &mut BufReader<R>,
+    compressed_size_bytes: u64,
+    workers: usize,
+    batch_records: usize,
+) -> Result<CheckpointUtxoScan> {
+    let workers = workers.max(1);
+    let batch_records = batch_records.max(1);
+
+    let (record_count, read_result, worker_results) = thread::scope(|scope| {
+        let mut senders = Vec::with_capacity(workers);
+        let mut handles = Vec::with_capacity(workers);
+        for _ in 0..workers {
+            let (sender, receiver) = mpsc::sync_channel::<CheckpointRecordBatch>(2);
+            senders.push(sender);
+            handles.push(scope.spawn(move || scan_checkpoint_record_batches(receiver)));
+        }
+
+        let mut record_count = 0u64;
+        let mut batch = CheckpointRecordBatch::new(record_count + 1, batch_records);
+        let mut next_worker = 0usize;
+        let read_result = loop {
+            let mut framed_size = [0u8; 1];
+            let bytes_read = match reader
+                .read(&mut framed_size)
+                .context("failed reading checkpoint record length")
+            {
+                Ok(bytes_read) => bytes_read,
+                Err(err) => break Err(err),
+            };
+            if bytes_read == 0 {
+                break Ok(());
+            }
+
+            let record_len = usize::from(framed_size[0]);
+            let record_start = batch.bytes.len();
+            batch.bytes.resize(record_start + record_len, 0);
+            if let Err(err) = reader
+                .read_exact(&mut batch.bytes[record_start..])
+                .with_context(|| {
+                    format!(
+                        "failed reading checkpoint record #{} payload ({record_len} bytes)",
+                        record_count + 1
+                    )
+                })
+            {
+                break Err(err);
+            }
+            batch.record_ends.push(batch.bytes.len());
+            record_count += 1;
+
+            if batch.record_ends.len() == batch_records {
+                let full = std::mem::replace(
+                    &mut batch,
+                    CheckpointRecordBatch::new(record_count + 1, batch_records),
+                );
+                if senders[next_worker].send(full).is_err() {
+                    // The worker bailed on a bad record; its error is collected below.
+                    break Ok(());
+                }
+                next_worker = (next_worker + 1) % workers;
+            }
+        };
+
+        if !batch.record_ends.is_empty() {
+            let _ = senders[next_worker].send(batch);
         }
+        drop(senders);
+
+        let worker_results = handles
+            .into_iter()
+            .map(|handle| {
+                handle
+                    .join()
+                    .unwrap_or_else(|_| Err((u64::MAX, anyhow!("checkpoint scan worker panicked"))))
+            })
+            .collect::<Vec<_>>();
+        (record_count, read_result, worker_results)
+    });
 
-        let record_len = usize::from(framed_size[0]);
-        let mut record = vec![0u8; record_len];
-        reader.read_exact(&mut record).with_context(|| {
-            format!(
-                "failed reading checkpoint record #{} payload ({record_len} bytes)",
-                record_count + 1
-            )
-        })?;
-
-        muhash.add_element(&record);
-        let decoded = deserialize_checkpoint_utxo(&record).with_context(|| {
-            format!(
-                "failed deserializing checkpoint record #{}",
-                record_count + 1
-            )
-        })?;
+    // Report the lowest-numbered bad record, as a sequential scan would have.
+    let mut partials = Vec::with_capacity(worker_results.len());
+    let mut first_error: Option<(u64, anyhow::Error)> = None;
+    for result in worker_results {
+        match result {
+            Ok(partial) => partials.push(partial),
+            Err((record_number, err)) => {
+                if first_error
+                    .as_ref()
+                    .is_none_or(|(first_number, _)| record_number < *first_number)
+                {
+                    first_error = Some((record_number, err));
+                }
+            }
+        }
+    }
+    if let Some((_, err)) = first_error {
+        return Err(err);
+    }
+    read_result?;
+
+    let mut muhash = MuHash::new();
+    let mut total_sompi = 0u64;
+    for partial in partials {
+        muhash.combine(&partial.muhash);
         total_sompi = total_sompi
-            .checked_add(decoded.amount_sompi)
+            .checked_add(partial.total_sompi)
             .context("checkpoint total overflowed u64")?;
-        record_count += 1;
     }
 
     let commitment = muhash.finalize().as_bytes();
@@ -173,6 +265,57 @@ fn scan_checkpoint_utxo_dump_reader<R: Read>(
     })
 }
 
+struct CheckpointRecordBatch {
+    first_record_number: u64,
+    bytes: Vec<u8>,
+    record_ends: Vec<usize>,
+}
+
+impl CheckpointRecordBatch {
+    fn new(first_record_number: u64, batch_records: usize) -> Self {
+        Self {
+            first_record_number,
+            bytes: Vec::with_capacity(batch_records * CHECKPOINT_UTXO_TYPICAL_RECORD_BYTES),
+            record_ends: Vec::with_capacity(batch_records),
+        }
+    }
+}
+
+struct CheckpointRecordBatchTotals {
+    muhash: MuHash,
+    total_sompi: u64,
+}
+
+fn scan_checkpoint_record_batches(
+    receiver: mpsc::Receiver<CheckpointRecordBatch>,
+) -> Result<CheckpointRecordBatchTotals, (u64, anyhow::Error)> {
+    let mut muhash = MuHash::new();
+    let mut total_sompi = 0u64;
+
+    for batch in receiver {
+        let mut record_start = 0usize;
+        for (record_number, &record_end) in
+            (batch.first_record_number..).zip(batch.record_ends.iter())
+        {
+            let record = &batch.bytes[record_start..record_end];
+            record_start = record_end;
+
+            muhash.add_element(record);
+            let decoded = deserialize_checkpoint_utxo(record)
+                .with_context(|| format!("failed deserializing checkpoint record #{record_number}"))
+                .map_err(|err| (record_number, err))?;
+            total_sompi = total_sompi
+                .checked_add(decoded.amount_sompi)
+                .ok_or_else(|| (record_number, anyhow!("checkpoint total overflowed u64")))?;
+        }
+    }
+
+    Ok(CheckpointRecordBatchTotals {
+        muhash,
+        total_sompi,
+    })
+}
+
 fn verify_checkpoint_scan(scan: &CheckpointUtxoScan, expected_commitment: Hash32) -> Result<()> {
     if scan.commitment != expected_commitment {
         bail!(
@@ -191,31 +334,22 @@ fn verify_checkpoint_scan(scan: &CheckpointUtxoScan, expected_commitment: Hash32
 }
 
 fn deserialize_checkpoint_utxo(record: &[u8]) -> Result<DecodedCheckpointUtxo> {
-    let mut cursor = Cursor::new(record);
-    let mut transaction_id = [0u8; 32];
-    cursor
-        .read_exact(&mut transaction_id)
-        .context("failed reading outpoint.transactionID")?;
-
-    let outpoint_index = read_u32_le(&mut cursor, "outpoint.index")?;
-    let block_daa_score = read_u64_le(&mut cursor, "entry.blockDAAScore")?;
-    let amount_sompi = read_u64_le(&mut cursor, "entry.amount")?;
-    let is_coinbase = read_bool(&mut cursor, "entry.isCoinbase")?;
-    let script_version = read_u16_le(&mut cursor, "script.version")?;
-    let script_pub_key_len = read_u64_le(&mut cursor, "scriptPubKeyLen")?;
+    let mut rest = record;
+    let transaction_id = read_array::<32>(&mut rest, "outpoint.transactionID")?;
+    let outpoint_index = u32::from_le_bytes(read_array(&mut rest, "outpoint.index")?);
+    let block_daa_score = u64::from_le_bytes(read_array(&mut rest, "entry.blockDAAScore")?);
+    let amount_sompi = u64::from_le_bytes(read_array(&mut rest, "entry.amount")?);
+    let is_coinbase = read_bool(&mut rest, "entry.isCoinbase")?;
+    let script_version = u16::from_le_bytes(read_array(&mut rest, "script.version")?);
+    let script_pub_key_len = u64::from_le_bytes(read_array(&mut rest, "scriptPubKeyLen")?);
     let script_len =
         usize::try_from(script_pub_key_len).context("scriptPubKeyLen does not fit in usize")?;
-    let mut script_pub_key = vec![0u8; script_len];
-    cursor
-        .read_exact(&mut script_pub_key)
+    let (script_pub_key, trailing) = rest
+        .split_at_checked(script_len)
         .context("failed reading script bytes")?;
 
-    if cursor.position() != u64::try_from(record.len()).expect("record len fits in u64") {
-        bail!(
-            "record contains {} trailing bytes",
-            record.len()
-                - usize::try_from(cursor.position()).expect("cursor position fits in usize")
-        );
+    if !trailing.is_empty() {
+        bail!("record contains {} trailing bytes", trailing.len());
     }
 
     Ok(DecodedCheckpointUtxo {
@@ -225,40 +359,21 @@ fn deserialize_checkpoint_utxo(record: &[u8]) -> Result<DecodedCheckpointUtxo> {
         amount_sompi,
         is_coinbase,
         script_version,
-        script_pub_key,
+        script_pub_key: script_pub_key.to_vec(),
     })
 }
 
-fn read_u16_le<R: Read>(reader: &mut R, field: &str) -> Result<u16> {
-    let mut bytes = [0u8; 2];
-    reader
-        .read_exact(&mut bytes)
-        .with_context(|| format!("failed reading {field}"))?;
-    Ok(u16::from_le_bytes(bytes))
-}
-
-fn read_u32_le<R: Read>(reader: &mut R, field: &str) -> Result<u32> {
-    let mut bytes = [0u8; 4];
-    reader
-        .read_exact(&mut bytes)
+fn read_array<const N: usize>(rest: &mut &[u8], field: &str) -> Result<[u8; N]> {
+    let (bytes, tail) = rest
+        .split_first_chunk::<N>()
         .with_context(|| format!("failed reading {field}"))?;
-    Ok(u32::from_le_bytes(bytes))
+    *rest = tail;
+    Ok(*bytes)
 }
 
-fn read_u64_le<R: Read>(reader: &mut R, field: &str) -> Result<u64> {
-    let mut bytes = [0u8; 8];
-    reader
-        .read_exact(&mut bytes)
-        .with_context(|| format!("failed reading {field}"))?;
-    Ok(u64::from_le_bytes(bytes))
-}
-
-fn read_bool<R: Read>(reader: &mut R, field: &str) -> Result<bool> {
-    let mut byte = [0u8; 1];
-    reader
-        .read_exact(&mut byte)
-        .with_context(|| format!("failed reading {field}"))?;
-    match byte[0] {
+fn read_bool(rest: &mut &[u8], field: &str) -> Result<bool> {
+    let [byte] = read_array::<1>(rest, field)?;
+    match byte {
         0x00 => Ok(false),
         0x01 => Ok(true),
         value => {
@@ -366,6 +481,67 @@ mod tests {
         assert!(scan.compressed_size_bytes > 0);
     }
 
+    fn gzip_framed_records(records: &[Vec<u8>]) -> Vec<u8> {
+        let mut gz = GzEncoder::new(Vec::new(), Compression::default());
+        for record in records {
+            gz.write_all(&[u8::try_from(record.len()).expect("record len fits in u8")])
+                .expect("write record len");
+            gz.write_all(record).expect("write record");
+        }
+        gz.finish().expect("finish gzip")
+    }
+
+    #[test]
+    fn parallel_scan_matches_sequential_muhash_across_batch_boundaries() {
+        let records = (0..11u8)
+            .map(|index| {
+                serialize_test_utxo(
+                    index,
+                    u32::from(index),
+                    5,
+                    u64::from(index) * 100,
+                    false,
+                    0,
+                    &[index],
+                )
+            })
+            .collect::<Vec<_>>();
+        let dump = gzip_framed_records(&records);
+
+        let mut expected_muhash = MuHash::new();
+        for record in &records {
+            expected_muhash.add_element(record);
+        }
+
+        let mut reader = BufReader::new(GzDecoder::new(Cursor::new(dump.as_slice())));
+        let scan = scan_checkpoint_utxo_dump_reader_parallel(&mut reader, 0, 3, 2)
+            .expect("scan dump in parallel");
+
+        assert_eq!(scan.record_count, 11);
+        assert_eq!(scan.total_sompi, 5_500);
+        assert_eq!(scan.commitment, expected_muhash.finalize().as_bytes());
+    }
+
+    #[test]
+    fn parallel_scan_reports_first_bad_record_number() {
+        let mut records = (0..9u8)
+            .map(|index| serialize_test_utxo(index, 0, 0, 1, false, 0, &[0x51]))
+            .collect::<Vec<_>>();
+        for bad in [4, 7] {
+            records[bad][52] = 0x02;
+        }
+        let dump = gzip_framed_records(&records);
+
+        let mut reader = BufReader::new(GzDecoder::new(Cursor::new(dump.as_slice())));
+        let err = scan_checkpoint_utxo_dump_reader_parallel(&mut reader, 0, 3, 2)
+            .expect_err("bad coinbase flag should fail the scan");
+
+        assert!(
+            format!("{err:#}").contains("checkpoint record #5"),
+            "unexpected error: {err:#}"
+        );
+    }
+
     #[test]
     fn format_kas_amount_from_sompi_keeps_eight_decimals() {
         assert_eq!(
@@ -1,20 +1,29 @@
 use anyhow::{Context, Result};
 use blake2b_simd::Params;
+use std::sync::LazyLock;
 
 use crate::model::{Hash32, ParsedHeader, Transaction};
 
 pub(crate) fn hash32_from_hex(hex_str: &str) -> Result<Hash32> {
-    let decoded = hex::decode(hex_str).with_context(|| format!("invalid hex: {hex_str}"))?;
-    decoded
-        .as_slice()
-        .try_into()
-        .map_err(|_| anyhow::anyhow!("expected 32 bytes, got {}", decoded.len()))
+    let mut out = [0u8; 32];
+    if hex_str.len() != out.len() * 2 {
+        let decoded = hex::decode(hex_str).with_context(|| format!("invalid hex: {hex_str}"))?;
+        anyhow::bail!("expected 32 bytes, got {}", decoded.len());
+    }
+
+    hex::decode_to_slice(hex_str, &mut out).with_context(|| format!("invalid hex: {hex_str}"))?;
+    Ok(out)
 }
 
 pub(crate) fn hex_of(hash: &Hash32) -> String {
     hex::encode(hash)
 }
 
+static BLOCK_HASH_STATE: LazyLock<blake2b_simd::State> =
+    LazyLock::new(|| new_blake2b_32(b"BlockHash"));
+static TRANSACTION_HASH_STATE: LazyLock<blake2b_simd::State> =
+    LazyLock::new(|| new_blake2b_32(b"TransactionHash"));
+
 fn new_blake2b_32(key: &[u8]) -> blake2b_simd::State {
     let mut params = Params::new();
     params.hash_length(32);
@@ -29,7 +38,7 @@ fn finalize_32(state: blake2b_simd::State) -> Hash32 {
 }
 
 pub(crate) fn header_hash(h: &ParsedHeader) -> Hash32 {
-    let mut hasher = new_blake2b_32(b"BlockHash");
+    let mut hasher = BLOCK_HASH_STATE.clone();
 
     hasher.update(&h.version.to_le_bytes());
     hasher.update(&(h.parents.len() as u64).to_le_bytes());
@@ -57,7 +66,7 @@ pub(crate) fn header_hash(h: &ParsedHeader) -> Hash32 {
 }
 
 pub(crate) fn transaction_hash(tx: &Transaction, include_mass_commitment: bool) -> Hash32 {
-    let mut hasher = new_blake2b_32(b"TransactionHash");
+    let mut hasher = TRANSACTION_HASH_STATE.clone();
 
     hasher.update(&tx.version.to_le_bytes());
     hasher.update(&(tx.inputs.len() as u64).to_le_bytes());
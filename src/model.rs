@@ -97,23 +97,25 @@ pub(crate) struct VerificationReport {
 }
 
 #[derive(Debug, Deserialize)]
-pub(crate) struct CheckpointJson {
-    pub(crate) checkpoint_hash: String,
-    pub(crate) original_genesis_hash: String,
-    pub(crate) headers_chain: Vec<CheckpointHeaderJson>,
+pub(crate) struct CheckpointJson<'a> {
+    pub(crate) checkpoint_hash: &'a str,
+    pub(crate) original_genesis_hash: &'a str,
+    #[serde(borrow)]
+    pub(crate) headers_chain: Vec<CheckpointHeaderJson<'a>>,
 }
 
 #[derive(Debug, Deserialize)]
-pub(crate) struct CheckpointHeaderJson {
-    pub(crate) hash: String,
+pub(crate) struct CheckpointHeaderJson<'a> {
+    pub(crate) hash: &'a str,
     pub(crate) version: u16,
-    pub(crate) parents: Vec<Vec<String>>,
+    #[serde(borrow)]
+    pub(crate) parents: Vec<Vec<&'a str>>,
     #[serde(rename = "hashMerkleRoot")]
-    pub(crate) hash_merkle_root: String,
+    pub(crate) hash_merkle_root: &'a str,
     #[serde(rename = "acceptedIDMerkleRoot")]
-    pub(crate) accepted_id_merkle_root: String,
+    pub(crate) accepted_id_merkle_root: &'a str,
     #[serde(rename = "utxoCommitment")]
-    pub(crate) utxo_commitment: String,
+    pub(crate) utxo_commitment: &'a str,
     #[serde(rename = "timeInMilliseconds")]
     pub(crate) time_in_milliseconds: u64,
     pub(crate) bits: u32,
@@ -123,7 +125,7 @@ pub(crate) struct CheckpointHeaderJson {
     #[serde(rename = "blueScore")]
     pub(crate) blue_score: u64,
     #[serde(rename = "blueWork")]
-    pub(crate) blue_work: String,
+    pub(crate) blue_work: &'a str,
     #[serde(rename = "pruningPoint")]
-    pub(crate) pruning_point: String,
+    pub(crate) pruning_point: &'a str,
 }
@@ -10,12 +10,20 @@ use crate::constants::{BLUE, BOLD, END, GREEN, RED, YELLOW};
 use crate::model::VerificationReport;
 
 static OUTPUT_CAPTURE: std::sync::OnceLock<Mutex<Vec<String>>> = std::sync::OnceLock::new();
+static STDOUT_IS_TERMINAL: std::sync::OnceLock<bool> = std::sync::OnceLock::new();
+
+pub(crate) fn ansi(code: &'static str) -> &'static str {
+    if *STDOUT_IS_TERMINAL.get_or_init(|| io::stdout().is_terminal()) {
+        code
+    } else {
+        ""
+    }
+}
 
 pub(crate) fn print_header(text: &str) {
     let sep = "=".repeat(60);
-    println!("\n{BOLD}{BLUE}{sep}{END}");
-    println!("{BOLD}{BLUE}{text}{END}");
-    println!("{BOLD}{BLUE}{sep}{END}");
+    let (bold, blue, end) = (ansi(BOLD), ansi(BLUE), ansi(END));
+    println!("\n{bold}{blue}{sep}{end}\n{bold}{blue}{text}{end}\n{bold}{blue}{sep}{end}");
     capture_output_line("");
     capture_output_line(&sep);
     capture_output_line(text);
@@ -23,22 +31,26 @@ pub(crate) fn print_header(text: &str) {
 }
 
 pub(crate) fn print_success(text: &str) {
-    println!("{GREEN}✓ {text}{END}");
+    let (green, end) = (ansi(GREEN), ansi(END));
+    println!("{green}✓ {text}{end}");
     capture_output_line(&format!("✓ {text}"));
 }
 
 pub(crate) fn print_error(text: &str) {
-    println!("{RED}✗ {text}{END}");
+    let (red, end) = (ansi(RED), ansi(END));
+    println!("{red}✗ {text}{end}");
     capture_output_line(&format!("✗ {text}"));
 }
 
 pub(crate) fn print_info(text: &str) {
-    println!("{GREEN}→ {text}{END}");
+    let (green, end) = (ansi(GREEN), ansi(END));
+    println!("{green}→ {text}{end}");
     capture_output_line(&format!("→ {text}"));
 }
 
 pub(crate) fn print_warning(text: &str) {
-    println!("{YELLOW}! {text}{END}");
+    let (yellow, end) = (ansi(YELLOW), ansi(END));
+    println!("{yellow}! {text}{end}");
     capture_output_line(&format!("! {text}"));
 }
 
@@ -48,7 +60,8 @@ pub(crate) fn print_plain(text: &str) {
 }
 
 pub(crate) fn print_prompt(text: &str) {
-    println!("{YELLOW}? {text}{END}");
+    let (yellow, end) = (ansi(YELLOW), ansi(END));
+    println!("{yellow}? {text}{end}");
     capture_output_line(&format!("? {text}"));
 }
 
@@ -143,7 +156,8 @@ pub(crate) fn prompt_export_json_decision(no_input: bool) -> Result<bool> {
         return Ok(false);
     }
 
-    println!("{YELLOW}? Do you want to export this verification to JSON? [y/N]{END}");
+    let (yellow, end) = (ansi(YELLOW), ansi(END));
+    println!("{yellow}? Do you want to export this verification to JSON? [y/N]{end}");
     let mut input = String::new();
     io::stdin()
         .read_line(&mut input)
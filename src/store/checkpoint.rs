@@ -23,7 +23,7 @@ impl CheckpointStore {
 
         let mut headers = HashMap::with_capacity(parsed.headers_chain.len());
         for entry in parsed.headers_chain {
-            let hash = hash32_from_hex(&entry.hash)
+            let hash = hash32_from_hex(entry.hash)
                 .with_context(|| format!("invalid checkpoint header hash {}", entry.hash))?;
 
             let mut parents = Vec::with_capacity(entry.parents.len());
@@ -31,7 +31,7 @@ impl CheckpointStore {
                 let mut level_hashes = Vec::with_capacity(level.len());
                 for parent_hex in level {
                     level_hashes.push(
-                        hash32_from_hex(&parent_hex).with_context(|| {
+                        hash32_from_hex(parent_hex).with_context(|| {
                             format!("invalid checkpoint parent hash {parent_hex}")
                         })?,
                     );
@@ -44,24 +44,24 @@ impl CheckpointStore {
                 ParsedHeader {
                     version: entry.version,
                     parents,
-                    hash_merkle_root: hash32_from_hex(&entry.hash_merkle_root)?,
-                    accepted_id_merkle_root: hash32_from_hex(&entry.accepted_id_merkle_root)?,
-                    utxo_commitment: hash32_from_hex(&entry.utxo_commitment)?,
+                    hash_merkle_root: hash32_from_hex(entry.hash_merkle_root)?,
+                    accepted_id_merkle_root: hash32_from_hex(entry.accepted_id_merkle_root)?,
+                    utxo_commitment: hash32_from_hex(entry.utxo_commitment)?,
                     time_in_milliseconds: entry.time_in_milliseconds,
                     bits: entry.bits,
                     nonce: entry.nonce,
                     daa_score: entry.daa_score,
                     blue_score: entry.blue_score,
-                    blue_work_trimmed_be: hex::decode(&entry.blue_work).with_context(|| {
+                    blue_work_trimmed_be: hex::decode(entry.blue_work).with_context(|| {
                         format!("invalid checkpoint blueWork {}", entry.blue_work)
                     })?,
-                    pruning_point: hash32_from_hex(&entry.pruning_point)?,
+                    pruning_point: hash32_from_hex(entry.pruning_point)?,
                 },
             );
         }
 
-        let checkpoint_hash = hash32_from_hex(&parsed.checkpoint_hash)?;
-        let original_genesis_hash = hash32_from_hex(&parsed.original_genesis_hash)?;
+        let checkpoint_hash = hash32_from_hex(parsed.checkpoint_hash)?;
+        let original_genesis_hash = hash32_from_hex(parsed.original_genesis_hash)?;
         if !headers.contains_key(&checkpoint_hash) {
             bail!(
                 "embedded checkpoint data is missing checkpoint hash {}",
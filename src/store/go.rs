@@ -96,48 +96,16 @@ impl HeaderSource for GoStore {
         for level in db_header.parents {
             let mut level_hashes = Vec::with_capacity(level.parent_hashes.len());
             for parent in level.parent_hashes {
-                level_hashes.push(
-                    parent
-                        .hash
-                        .as_slice()
-                        .try_into()
-                        .map_err(|_| anyhow!("invalid parent hash length"))?,
-                );
+                level_hashes.push(hash32_from_db_bytes(&parent.hash, "parent hash")?);
             }
             parents.push(level_hashes);
         }
 
-        let hash_merkle_root = db_header
-            .hash_merkle_root
-            .ok_or_else(|| anyhow!("missing hash_merkle_root"))?
-            .hash
-            .as_slice()
-            .try_into()
-            .map_err(|_| anyhow!("invalid hash_merkle_root length"))?;
-
-        let accepted_id_merkle_root = db_header
-            .accepted_id_merkle_root
-            .ok_or_else(|| anyhow!("missing accepted_id_merkle_root"))?
-            .hash
-            .as_slice()
-            .try_into()
-            .map_err(|_| anyhow!("invalid accepted_id_merkle_root length"))?;
-
-        let utxo_commitment = db_header
-            .utxo_commitment
-            .ok_or_else(|| anyhow!("missing utxo_commitment"))?
-            .hash
-            .as_slice()
-            .try_into()
-            .map_err(|_| anyhow!("invalid utxo_commitment length"))?;
-
-        let pruning_point = db_header
-            .pruning_point
-            .ok_or_else(|| anyhow!("missing pruning_point"))?
-            .hash
-            .as_slice()
-            .try_into()
-            .map_err(|_| anyhow!("invalid pruning_point length"))?;
+        let hash_merkle_root = required_db_hash(db_header.hash_merkle_root, "hash_merkle_root")?;
+        let accepted_id_merkle_root =
+            required_db_hash(db_header.accepted_id_merkle_root, "accepted_id_merkle_root")?;
+        let utxo_commitment = required_db_hash(db_header.utxo_commitment, "utxo_commitment")?;
+        let pruning_point = required_db_hash(db_header.pruning_point, "pruning_point")?;
 
         let time_in_milliseconds =
             u64::try_from(db_header.time_in_milliseconds).with_context(|| {
@@ -186,11 +154,7 @@ impl HeaderStore for GoStore {
 
         let db_hst = proto::DbHash::decode(hst_bytes.as_ref())
             .context("failed decoding headers-selected-tip DbHash")?;
-        let hst = db_hst
-            .hash
-            .as_slice()
-            .try_into()
-            .map_err(|_| anyhow!("invalid headers-selected-tip hash length"))?;
+        let hst = hash32_from_db_bytes(&db_hst.hash, "headers-selected-tip hash")?;
 
         let tips_key = go_db_key(self.active_prefix, b"tips", None);
         let tips_bytes = self
@@ -200,20 +164,27 @@ impl HeaderStore for GoStore {
         let db_tips =
             proto::DbTips::decode(tips_bytes.as_ref()).context("failed decoding DbTips")?;
 
-        let mut tips = Vec::with_capacity(db_tips.tips.len());
-        for tip in db_tips.tips {
-            tips.push(
-                tip.hash
-                    .as_slice()
-                    .try_into()
-                    .map_err(|_| anyhow!("invalid tip hash length"))?,
-            );
-        }
+        let tips = db_tips
+            .tips
+            .iter()
+            .map(|tip| hash32_from_db_bytes(&tip.hash, "tip hash"))
+            .collect::<Result<Vec<_>>>()?;
 
         Ok((tips, hst))
     }
 }
 
+fn hash32_from_db_bytes(bytes: &[u8], field: &str) -> Result<Hash32> {
+    bytes
+        .try_into()
+        .map_err(|_| anyhow!("invalid {field} length"))
+}
+
+fn required_db_hash(db_hash: Option<proto::DbHash>, field: &str) -> Result<Hash32> {
+    let db_hash = db_hash.ok_or_else(|| anyhow!("missing {field}"))?;
+    hash32_from_db_bytes(&db_hash.hash, field)
+}
+
 pub(crate) fn go_db_key(prefix: u8, bucket: &[u8], suffix: Option<&[u8]>) -> Vec<u8> {
     let mut key = Vec::with_capacity(2 + bucket.len() + suffix.map(|s| 1 + s.len()).unwrap_or(0));
     key.push(prefix);
@@ -48,14 +48,15 @@ fn list_consensus_dirs(consensus_root: &Path) -> Result<Vec<PathBuf>> {
     for entry in entries {
         let entry = entry
             .with_context(|| format!("failed reading entry in {}", consensus_root.display()))?;
-        let path = entry.path();
-        if !path.is_dir() {
+        let is_consensus_name = entry
+            .file_name()
+            .to_str()
+            .is_some_and(|name| name.starts_with("consensus-"));
+        if !is_consensus_name {
             continue;
         }
-        let Some(name) = path.file_name().and_then(|segment| segment.to_str()) else {
-            continue;
-        };
-        if name.starts_with("consensus-") {
+        let path = entry.path();
+        if path.is_dir() {
             dirs.push(path);
         }
     }
@@ -163,28 +164,39 @@ pub(crate) fn resolve_rust_db_path(input_path: &Path) -> Result<RustDbResolution
 
     let mut consensus_root = None;
     let mut meta_path = None;
+    let mut scanned_dirs = None;
 
-    if input_path.join("consensus").is_dir() {
-        consensus_root = Some(input_path.join("consensus"));
-        if input_path.join("meta").is_dir() {
-            meta_path = Some(input_path.join("meta"));
+    let nested_consensus_root = input_path.join("consensus");
+    if nested_consensus_root.is_dir() {
+        let nested_meta_path = input_path.join("meta");
+        if nested_meta_path.is_dir() {
+            meta_path = Some(nested_meta_path);
         }
+        consensus_root = Some(nested_consensus_root);
     }
 
     if consensus_root.is_none() {
-        let is_consensus_root = input_path
+        let is_consensus_root = if input_path
             .file_name()
             .and_then(|segment| segment.to_str())
             .map(|name| name == "consensus")
             .unwrap_or(false)
-            || !list_consensus_dirs(input_path)?.is_empty();
+        {
+            true
+        } else {
+            let dirs = list_consensus_dirs(input_path)?;
+            let found = !dirs.is_empty();
+            scanned_dirs = Some(dirs);
+            found
+        };
 
         if is_consensus_root {
             consensus_root = Some(input_path.to_path_buf());
-            if let Some(parent) = input_path.parent()
-                && parent.join("meta").is_dir()
-            {
-                meta_path = Some(parent.join("meta"));
+            if let Some(parent) = input_path.parent() {
+                let parent_meta_path = parent.join("meta");
+                if parent_meta_path.is_dir() {
+                    meta_path = Some(parent_meta_path);
+                }
             }
         }
     }
@@ -196,7 +208,11 @@ pub(crate) fn resolve_rust_db_path(input_path: &Path) -> Result<RustDbResolution
         );
     };
 
-    let dirs = list_consensus_dirs(&consensus_root)?;
+    // A root found by scanning the input path was already listed above.
+    let dirs = match scanned_dirs {
+        Some(dirs) => dirs,
+        None => list_consensus_dirs(&consensus_root)?,
+    };
     if dirs.is_empty() {
         bail!(
             "no consensus-* directories found under {}",
@@ -1,5 +1,5 @@
 use anyhow::{Context, Result, anyhow, bail};
-use rocksdb::{DB as RocksDb, Direction, IteratorMode, Options as RocksOptions};
+use rocksdb::{DB as RocksDb, Direction, IteratorMode, Options as RocksOptions, ReadOptions};
 use serde::Deserialize;
 use std::collections::BTreeSet;
 use std::path::Path;
@@ -11,6 +11,8 @@ use crate::model::{Hash32, HeaderSource, HeaderStore, ParsedHeader};
 
 use super::probe::RustDbResolution;
 
+const RUST_HEADER_KEY_PREFIXES: [u8; 2] = [32, 8];
+
 #[derive(Debug)]
 pub(crate) struct RustStore {
     db: RocksDb,
@@ -77,22 +79,12 @@ impl RustStore {
 
 impl HeaderSource for RustStore {
     fn get_raw_header(&mut self, block_hash: &Hash32) -> Result<Option<ParsedHeader>> {
-        for prefix in [32u8, 8u8] {
-            let mut key = Vec::with_capacity(33);
-            key.push(prefix);
-            key.extend_from_slice(block_hash);
-
-            if let Some(bytes) = self
-                .db
-                .get(&key)
-                .with_context(|| format!("reading rust header key with prefix {prefix}"))?
-                && let Ok(header) = decode_rust_header(&bytes)
-            {
-                return Ok(Some(header));
-            }
-        }
-
-        Ok(None)
+        first_decodable_rust_header(RUST_HEADER_KEY_PREFIXES.iter().map(|&prefix| {
+            (
+                prefix,
+                self.db.get_pinned(rust_header_key(prefix, block_hash)),
+            )
+        }))
     }
 }
 
@@ -116,27 +108,20 @@ impl HeaderStore for RustStore {
             .context("reading rust headers selected tip key")?
             .ok_or_else(|| anyhow!("headers selected tip key not found"))?;
 
-        let hst = hst_bytes
-            .get(..32)
-            .ok_or_else(|| {
-                anyhow!(
-                    "headers selected tip value is too short: {} bytes",
-                    hst_bytes.len()
-                )
-            })?
-            .try_into()
-            .map_err(|_| {
-                anyhow!(
-                    "headers selected tip value is too short: {} bytes",
-                    hst_bytes.len()
-                )
-            })?;
+        let hst = *hst_bytes.first_chunk::<32>().ok_or_else(|| {
+            anyhow!(
+                "headers selected tip value is too short: {} bytes",
+                hst_bytes.len()
+            )
+        })?;
 
         let mut seen_tips = BTreeSet::new();
         let mut tips = Vec::new();
+        let mut read_opts = ReadOptions::default();
+        read_opts.set_iterate_upper_bound(vec![25u8]);
         let iter = self
             .db
-            .iterator(IteratorMode::From(&[24u8], Direction::Forward));
+            .iterator_opt(IteratorMode::From(&[24u8], Direction::Forward), read_opts);
 
         for item in iter {
             let (key, _value) = item.context("iterating rust tips prefix")?;
@@ -154,24 +139,60 @@ impl HeaderStore for RustStore {
     }
 }
 
-fn trimmed_blue_work_from_words(words: [u64; 3]) -> Vec<u8> {
-    let mut le = [0u8; 24];
-    for (index, word) in words.iter().enumerate() {
-        le[index * 8..(index + 1) * 8].copy_from_slice(&word.to_le_bytes());
+fn rust_header_key(prefix: u8, block_hash: &Hash32) -> [u8; 33] {
+    let mut key = [0u8; 33];
+    key[0] = prefix;
+    key[1..].copy_from_slice(block_hash);
+    key
+}
+
+fn first_decodable_rust_header<B: AsRef<[u8]>>(
+    candidates: impl IntoIterator<Item = (u8, Result<Option<B>, rocksdb::Error>)>,
+) -> Result<Option<ParsedHeader>> {
+    let mut decode_error = None;
+    for (prefix, value) in candidates {
+        let Some(bytes) =
+            value.with_context(|| format!("reading rust header key with prefix {prefix}"))?
+        else {
+            continue;
+        };
+
+        match decode_rust_header(bytes.as_ref()) {
+            Ok(header) => return Ok(Some(header)),
+            Err(err) => {
+                decode_error.get_or_insert(
+                    err.context(format!("decoding rust header key with prefix {prefix}")),
+                );
+            }
+        }
+    }
+
+    match decode_error {
+        Some(err) => Err(err),
+        None => Ok(None),
+    }
+}
+
+pub(super) fn trimmed_blue_work_from_words(words: [u64; 3]) -> Vec<u8> {
+    let mut be = [0u8; 24];
+    for (chunk, word) in be.chunks_exact_mut(8).zip(words.iter().rev()) {
+        chunk.copy_from_slice(&word.to_be_bytes());
     }
 
-    let mut be = le;
-    be.reverse();
     let start = be.iter().position(|byte| *byte != 0).unwrap_or(be.len());
     be[start..].to_vec()
 }
 
-fn expand_compressed_parents(runs: &[(u8, Vec<Hash32>)]) -> Result<Vec<Vec<Hash32>>> {
-    let mut out = Vec::new();
+pub(super) fn expand_compressed_parents(runs: Vec<(u8, Vec<Hash32>)>) -> Result<Vec<Vec<Hash32>>> {
+    let level_count = runs
+        .last()
+        .map(|(cumulative, _)| usize::from(*cumulative))
+        .unwrap_or(0);
+    let mut out = Vec::with_capacity(level_count);
     let mut previous = 0u8;
 
     for (cumulative, parents) in runs {
-        if *cumulative <= previous {
+        if cumulative <= previous {
             bail!(
                 "invalid compressed parents: non-increasing cumulative count {} <= {}",
                 cumulative,
@@ -179,10 +200,11 @@ fn expand_compressed_parents(runs: &[(u8, Vec<Hash32>)]) -> Result<Vec<Vec<Hash3
             );
         }
 
-        for _ in 0..(*cumulative - previous) {
+        for _ in 1..(cumulative - previous) {
             out.push(parents.clone());
         }
-        previous = *cumulative;
+        out.push(parents);
+        previous = cumulative;
     }
 
     Ok(out)
@@ -192,7 +214,7 @@ fn convert_header_wire_compressed(header: HeaderWireCompressed) -> Result<Parsed
     let _ = header.hash;
     Ok(ParsedHeader {
         version: header.version,
-        parents: expand_compressed_parents(&header.parents_by_level.0)?,
+        parents: expand_compressed_parents(header.parents_by_level.0)?,
         hash_merkle_root: header.hash_merkle_root,
         accepted_id_merkle_root: header.accepted_id_merkle_root,
         utxo_commitment: header.utxo_commitment,
@@ -225,25 +247,38 @@ fn convert_header_wire_legacy(header: HeaderWireLegacy) -> ParsedHeader {
 }
 
 fn decode_rust_header(bytes: &[u8]) -> Result<ParsedHeader> {
-    if let Ok(wire) = bincode::deserialize::<HeaderWithBlockLevelWireCompressed>(bytes) {
-        let _ = wire.block_level;
-        return convert_header_wire_compressed(wire.header);
-    }
-
-    if let Ok(wire) = bincode::deserialize::<HeaderWithBlockLevelWireLegacy>(bytes) {
-        let _ = wire.block_level;
-        return Ok(convert_header_wire_legacy(wire.header));
-    }
+    let compressed_with_level_err =
+        match bincode::deserialize::<HeaderWithBlockLevelWireCompressed>(bytes) {
+            Ok(wire) => {
+                let _ = wire.block_level;
+                return convert_header_wire_compressed(wire.header);
+            }
+            Err(err) => err,
+        };
+
+    let legacy_with_level_err = match bincode::deserialize::<HeaderWithBlockLevelWireLegacy>(bytes)
+    {
+        Ok(wire) => {
+            let _ = wire.block_level;
+            return Ok(convert_header_wire_legacy(wire.header));
+        }
+        Err(err) => err,
+    };
 
-    if let Ok(wire) = bincode::deserialize::<HeaderWireCompressed>(bytes) {
-        return convert_header_wire_compressed(wire);
-    }
+    let compressed_err = match bincode::deserialize::<HeaderWireCompressed>(bytes) {
+        Ok(wire) => return convert_header_wire_compressed(wire),
+        Err(err) => err,
+    };
 
-    if let Ok(wire) = bincode::deserialize::<HeaderWireLegacy>(bytes) {
-        return Ok(convert_header_wire_legacy(wire));
-    }
+    let legacy_err = match bincode::deserialize::<HeaderWireLegacy>(bytes) {
+        Ok(wire) => return Ok(convert_header_wire_legacy(wire)),
+        Err(err) => err,
+    };
 
-    bail!("failed decoding rust header in known bincode formats")
+    bail!(
+        "failed decoding rust header ({} bytes) in known bincode formats: compressed+level: {compressed_with_level_err}; legacy+level: {legacy_with_level_err}; compressed: {compressed_err}; legacy: {legacy_err}",
+        bytes.len()
+    )
 }
 
 pub(crate) fn decode_tip_hash_from_key_suffix(suffix: &[u8]) -> Option<Hash32> {
@@ -251,12 +286,11 @@ pub(crate) fn decode_tip_hash_from_key_suffix(suffix: &[u8]) -> Option<Hash32> {
         return suffix.try_into().ok();
     }
 
-    if suffix.len() >= 40 {
-        let mut len_bytes = [0u8; 8];
-        len_bytes.copy_from_slice(&suffix[0..8]);
-        if u64::from_le_bytes(len_bytes) == 32 {
-            return suffix[8..40].try_into().ok();
-        }
+    if let Some((len_bytes, rest)) = suffix.split_first_chunk::<8>()
+        && u64::from_le_bytes(*len_bytes) == 32
+        && let Some(hash) = rest.first_chunk::<32>()
+    {
+        return Some(*hash);
     }
 
     if suffix.len() >= 32 {
@@ -8,14 +8,18 @@ use crate::model::{HeaderSource, HeaderStore};
 use crate::test_support::{
     create_consensus_db, create_go_leveldb, create_meta_db, create_temp_datadir,
     encode_consensus_entry, encode_db_block_header, encode_db_hash, encode_db_tips,
-    encode_option_u64, go_bucketed_key, sample_go_header, test_hash,
+    encode_option_u64, encode_rust_header, go_bucketed_key, make_tip_header, sample_go_header,
+    test_hash,
 };
 
 use super::go::go_db_key;
 use super::probe::{
     parse_consensus_entry_dir_name, parse_current_consensus_key, resolve_rust_db_path,
 };
-use super::rust::{decode_tip_hash_from_key_suffix, is_transient_rocksdb_open_failure};
+use super::rust::{
+    decode_tip_hash_from_key_suffix, expand_compressed_parents, is_transient_rocksdb_open_failure,
+    trimmed_blue_work_from_words,
+};
 use super::{CheckpointStore, GoStore, RustStore, open_store_with_resolved_input};
 
 #[test]
@@ -184,6 +188,34 @@ fn decode_tip_hash_from_key_suffix_supports_length_prefixed_tip_keys() {
     );
 }
 
+#[test]
+fn trimmed_blue_work_from_words_emits_big_endian_without_leading_zeros() {
+    assert_eq!(
+        trimmed_blue_work_from_words([0x0102_0304_0506_0708, 0x0a0b, 0]),
+        vec![0x0a, 0x0b, 0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08]
+    );
+    assert!(trimmed_blue_work_from_words([0, 0, 0]).is_empty());
+}
+
+#[test]
+fn expand_compressed_parents_repeats_each_run_up_to_its_cumulative_level() {
+    let low = vec![test_hash(0x01), test_hash(0x02)];
+    let high = vec![test_hash(0x03)];
+
+    let expanded =
+        expand_compressed_parents(vec![(2, low.clone()), (3, high.clone())]).expect("expand");
+
+    assert_eq!(expanded, vec![low.clone(), low, high]);
+}
+
+#[test]
+fn expand_compressed_parents_rejects_non_increasing_runs() {
+    let err = expand_compressed_parents(vec![(2, vec![test_hash(0x01)]), (2, Vec::new())])
+        .expect_err("non-increasing runs should fail");
+
+    assert!(format!("{err:#}").contains("non-increasing cumulative count"));
+}
+
 #[test]
 fn rust_store_tips_reads_live_style_tip_keys() {
     let (_tempdir, datadir, consensus_root) = create_temp_datadir();
@@ -235,6 +267,77 @@ fn rust_store_tips_preserves_iterator_order_without_hash_sorting() {
     assert_eq!(tips, vec![length_prefixed_tip, raw_tip]);
 }
 
+#[test]
+fn rust_store_get_raw_header_reads_both_key_prefixes() {
+    let (_tempdir, datadir, consensus_root) = create_temp_datadir();
+    let db_path = consensus_root.join("consensus-002");
+    let (compressed_prefix_hash, compressed_prefix_header) = make_tip_header(test_hash(0x01), 11);
+    let (legacy_prefix_hash, legacy_prefix_header) = make_tip_header(test_hash(0x02), 22);
+    let missing_hash = test_hash(0x03);
+
+    create_consensus_db(
+        &db_path,
+        &[
+            (vec![7u8], compressed_prefix_hash.to_vec()),
+            (
+                [vec![32u8], compressed_prefix_hash.to_vec()].concat(),
+                encode_rust_header(compressed_prefix_hash, &compressed_prefix_header),
+            ),
+            (
+                [vec![8u8], legacy_prefix_hash.to_vec()].concat(),
+                encode_rust_header(legacy_prefix_hash, &legacy_prefix_header),
+            ),
+        ],
+    );
+
+    let mut store = RustStore::open(&datadir).expect("open rust store");
+    for expected_hash in [compressed_prefix_hash, legacy_prefix_hash] {
+        assert_eq!(
+            store
+                .get_raw_header(&expected_hash)
+                .expect("header lookup")
+                .map(|header| header_hash(&header)),
+            Some(expected_hash)
+        );
+    }
+    assert!(
+        store
+            .get_raw_header(&missing_hash)
+            .expect("missing header lookup")
+            .is_none()
+    );
+}
+
+#[test]
+fn rust_store_get_raw_header_reports_undecodable_header_bytes() {
+    let (_tempdir, datadir, consensus_root) = create_temp_datadir();
+    let db_path = consensus_root.join("consensus-002");
+    let corrupt_hash = test_hash(0x04);
+
+    create_consensus_db(
+        &db_path,
+        &[
+            (vec![7u8], corrupt_hash.to_vec()),
+            (
+                [vec![32u8], corrupt_hash.to_vec()].concat(),
+                vec![0xde, 0xad, 0xbe, 0xef],
+            ),
+        ],
+    );
+
+    let mut store = RustStore::open(&datadir).expect("open rust store");
+    let err = store
+        .get_raw_header(&corrupt_hash)
+        .expect_err("corrupt header bytes should not read as a missing header");
+
+    let message = format!("{err:#}");
+    assert!(message.contains("prefix 32"), "unexpected error: {message}");
+    assert!(
+        message.contains("known bincode formats"),
+        "unexpected error: {message}"
+    );
+}
+
 #[test]
 fn rust_store_tips_returns_empty_list_when_tip_store_is_empty() {
     let (_tempdir, _datadir, consensus_root) = create_temp_datadir();
@@ -214,6 +214,35 @@ pub(crate) fn encode_consensus_entry(
     bytes
 }
 
+pub(crate) fn encode_rust_header(hash: Hash32, header: &ParsedHeader) -> Vec<u8> {
+    let mut bytes = Vec::new();
+    bytes.extend_from_slice(&hash);
+    bytes.extend_from_slice(&header.version.to_le_bytes());
+    bytes.extend_from_slice(&(header.parents.len() as u64).to_le_bytes());
+    for (level, parents) in header.parents.iter().enumerate() {
+        bytes.push(u8::try_from(level + 1).expect("parent level fits in u8"));
+        bytes.extend_from_slice(&(parents.len() as u64).to_le_bytes());
+        for parent in parents {
+            bytes.extend_from_slice(parent);
+        }
+    }
+    bytes.extend_from_slice(&header.hash_merkle_root);
+    bytes.extend_from_slice(&header.accepted_id_merkle_root);
+    bytes.extend_from_slice(&header.utxo_commitment);
+    bytes.extend_from_slice(&header.time_in_milliseconds.to_le_bytes());
+    bytes.extend_from_slice(&header.bits.to_le_bytes());
+    bytes.extend_from_slice(&header.nonce.to_le_bytes());
+    bytes.extend_from_slice(&header.daa_score.to_le_bytes());
+    let mut blue_work_le = header.blue_work_trimmed_be.clone();
+    blue_work_le.reverse();
+    blue_work_le.resize(24, 0);
+    bytes.extend_from_slice(&blue_work_le);
+    bytes.extend_from_slice(&header.blue_score.to_le_bytes());
+    bytes.extend_from_slice(&header.pruning_point);
+    bytes.push(0);
+    bytes
+}
+
 pub(crate) fn encode_db_hash(hash: Hash32) -> Vec<u8> {
     proto::DbHash {
         hash: hash.to_vec(),
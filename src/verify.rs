@@ -1,4 +1,5 @@
 use anyhow::{Context, Result};
+use std::collections::HashSet;
 use std::path::Path;
 
 use crate::checkpoint_utxo::{
@@ -11,8 +12,8 @@ use crate::model::{
     Hash32, HeaderSource, HeaderStore, ParsedHeader, Transaction, VerificationReport,
 };
 use crate::output::{
-    capture_output_line, format_duration_ms, now_millis, print_error, print_header, print_info,
-    print_success, print_warning, prompt_continue_on_sync_warning,
+    ansi, capture_output_line, format_duration_ms, now_millis, print_error, print_header,
+    print_info, print_success, print_warning, prompt_continue_on_sync_warning,
 };
 use crate::store::{CheckpointStore, GoStore, OpenStoreResult, open_store_with_resolved_input};
 use crate::{
@@ -64,6 +65,7 @@ fn assert_cryptographic_hash_chain_to_genesis(
     verbose: bool,
 ) -> Result<bool> {
     let mut steps: usize = 0;
+    let mut visited = HashSet::new();
 
     loop {
         if block_hash == genesis_hash {
@@ -75,6 +77,14 @@ fn assert_cryptographic_hash_chain_to_genesis(
             return Ok(true);
         }
 
+        if !visited.insert(block_hash) {
+            print_error(&format!(
+                "Pruning-point cycle detected at block {}",
+                hex_of(&block_hash)
+            ));
+            return Ok(false);
+        }
+
         let Some(header) = source.get_raw_header(&block_hash)? else {
             print_error(&format!(
                 "Header not found for hash: {}",
@@ -102,10 +112,21 @@ fn assert_cryptographic_hash_chain_to_genesis(
 
         block_hash = header.pruning_point;
         steps += 1;
+    }
+}
 
-        if steps > 100_000 {
-            print_error("Too many iterations in hash chain verification (safety stop)");
-            return Ok(false);
+fn read_sync_advisory_header(
+    store: &mut dyn HeaderStore,
+    block_hash: &Hash32,
+) -> Option<ParsedHeader> {
+    match store.get_raw_header(block_hash) {
+        Ok(header) => header,
+        Err(err) => {
+            print_warning(&format!(
+                "Could not read header {} for the sync advisory: {err:#}",
+                hex_of(block_hash)
+            ));
+            None
         }
     }
 }
@@ -119,10 +140,9 @@ pub(crate) fn original_genesis_coinbase_tx() -> Result<Transaction> {
 }
 
 fn genesis_coinbase_tx_from_payload_hex(payload_hex: &str) -> Result<Transaction> {
-    let subnetwork_id_bytes = hex::decode(MAINNET_SUBNETWORK_ID_COINBASE_HEX)
-        .context("invalid coinbase subnetwork id constant")?;
     let mut subnetwork_id = [0u8; 20];
-    subnetwork_id.copy_from_slice(&subnetwork_id_bytes);
+    hex::decode_to_slice(MAINNET_SUBNETWORK_ID_COINBASE_HEX, &mut subnetwork_id)
+        .context("invalid coinbase subnetwork id constant")?;
 
     let payload = hex::decode(payload_hex).context("invalid genesis coinbase payload hex")?;
 
@@ -188,7 +208,8 @@ where
     report.chain_tip_used = Some(hex_of(&chain_tip));
     report.tips = tips.iter().map(hex_of).collect();
 
-    let hst_header = store.get_raw_header(&hst)?;
+    // These headers only feed the sync advisory, so read failures stay warnings here.
+    let hst_header = read_sync_advisory_header(store, &hst);
     if let Some(header) = hst_header.as_ref() {
         report.headers_selected_tip_timestamp_ms = Some(header.time_in_milliseconds);
         if chain_tip != hst {
@@ -208,7 +229,7 @@ where
             "Proof chain tip selected from DAG tips: {}",
             hex_of(&chain_tip)
         ));
-        store.get_raw_header(&chain_tip)?
+        read_sync_advisory_header(store, &chain_tip)
     };
 
     if let Some(chain_tip_header) = chain_tip_header {
@@ -418,7 +439,7 @@ where
         hex_of(&empty_muhash)
     ));
 
-    if utxo_commitment.iter().all(|b| *b == 0) {
+    if utxo_commitment == [0u8; 32] {
         print_info("Status: All-zero UTXO commitment (should not occur)");
     } else if utxo_commitment == empty_muhash {
         print_info("Status: Empty UTXO commitment (original genesis)");
@@ -724,7 +745,8 @@ where
 
     print_success("The Kaspa blockchain integrity has been verified");
     print_success("No premine detected - UTXO set evolved from empty state");
-    println!("\n{BOLD}Thank you for verifying the integrity of Kaspa!{END}");
+    let (bold, end) = (ansi(BOLD), ansi(END));
+    println!("\n{bold}Thank you for verifying the integrity of Kaspa!{end}");
     capture_output_line("");
     capture_output_line("Thank you for verifying the integrity of Kaspa!");
 
@@ -8,10 +8,11 @@ use crate::constants::{
 };
 use crate::hashing::{hash32_from_hex, header_hash, hex_of, transaction_hash};
 use crate::output::{clear_output_capture, now_millis};
+use crate::store::RustStore;
 use crate::test_support::{
-    FakeStore, base_report, create_go_leveldb, embedded_checkpoint_headers_for_external_store,
-    fake_store_with_tip, hardwired_genesis_header, make_tip_header, original_genesis_header,
-    test_hash,
+    FakeStore, base_report, create_consensus_db, create_go_leveldb, create_temp_datadir,
+    embedded_checkpoint_headers_for_external_store, encode_rust_header, fake_store_with_tip,
+    hardwired_genesis_header, make_tip_header, original_genesis_header, test_hash,
 };
 
 use super::{
@@ -490,6 +491,60 @@ fn verify_genesis_sync_warning_never_aborts_proof_flow() {
     assert_eq!(report.error, None);
 }
 
+#[test]
+fn verify_genesis_treats_undecodable_hst_header_as_advisory_only() {
+    clear_output_capture();
+    let hardwired_genesis =
+        hash32_from_hex(HARDWIRED_GENESIS_HASH_HEX).expect("hardwired genesis hash");
+    let tip_time = now_millis().expect("now");
+    let (tip_hash, tip_header) = make_tip_header(hardwired_genesis, tip_time);
+    let corrupt_hst = test_hash(0x5c);
+
+    let (_tempdir, datadir, consensus_root) = create_temp_datadir();
+    create_consensus_db(
+        &consensus_root.join("consensus-002"),
+        &[
+            (vec![7u8], corrupt_hst.to_vec()),
+            ([vec![24u8], tip_hash.to_vec()].concat(), Vec::new()),
+            (
+                [vec![32u8], corrupt_hst.to_vec()].concat(),
+                vec![0xde, 0xad, 0xbe, 0xef],
+            ),
+            (
+                [vec![32u8], tip_hash.to_vec()].concat(),
+                encode_rust_header(tip_hash, &tip_header),
+            ),
+            (
+                [vec![32u8], hardwired_genesis.to_vec()].concat(),
+                encode_rust_header(hardwired_genesis, &hardwired_genesis_header()),
+            ),
+        ],
+    );
+    let mut store = RustStore::open(&datadir).expect("open rust store");
+    let mut report = base_report();
+    let probe_notes = Vec::new();
+
+    let result = verify_genesis_with_prompt(
+        &mut store,
+        test_inputs(
+            Path::new("/tmp/fake-input"),
+            None,
+            None,
+            &probe_notes,
+            false,
+            true,
+        ),
+        &mut report,
+        |_| Ok(true),
+    )
+    .expect("undecodable HST header must not abort the proof");
+
+    assert!(result);
+    assert_eq!(report.error, None);
+    assert_eq!(report.headers_selected_tip_timestamp_ms, None);
+    assert_eq!(report.chain_tip_timestamp_ms, Some(tip_time));
+}
+
 #[test]
 fn verify_genesis_fails_when_tip_header_is_missing() {
     clear_output_capture();